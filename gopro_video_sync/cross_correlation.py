@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.signal import correlate
+from scipy.fft import irfft, next_fast_len, rfft
 
 
 def get_offset(data_1: np.ndarray, data_2: np.ndarray, sample_rate: int) -> float:
@@ -9,18 +9,46 @@ def get_offset(data_1: np.ndarray, data_2: np.ndarray, sample_rate: int) -> floa
     the signals must share distinct features, the offset must be small relative
     to the total duration, and the streams must cover a similar time frame.
 
+    The arrays may either be 1-D or 2-D with one column per channel, in which
+    case the correlations of the channels are summed.
+
     Returns the offset in seconds that would have to be added to the beginning
     of `data_2` for it to line up with `data_1` (or vice versa for a negative
     value).
     """
 
-    # Pad with median so that we get clearer results than padding with 0
-    median_padding = np.tile(np.median(data_1, axis=0, keepdims=True), (data_2.shape[0], 1))
-    data_1_padded = np.concatenate((median_padding, data_1, median_padding))
+    if data_1.ndim == 1:
+        data_1 = data_1[:, np.newaxis]
+    if data_2.ndim == 1:
+        data_2 = data_2[:, np.newaxis]
+    length_1 = data_1.shape[0]
+    length_2 = data_2.shape[0]
+
+    # Start of `data_2` relative to `data_1` for each lag of the full
+    # correlation, and the range of `data_2` that overlaps `data_1` there
+    starts = np.arange(-(length_2 - 1), length_1)
+    overlap_begin = np.clip(-starts, 0, length_2)
+    overlap_end = np.clip(length_1 - starts, 0, length_2)
+
+    # Correlate every channel with a single-sided real FFT in float32, summing
+    # the channels in the frequency domain so only one inverse FFT is needed
+    length = length_1 + length_2 - 1
+    fft_length = next_fast_len(length, real=True)
+    spectrum_1 = rfft(data_1.astype(np.float32), fft_length, axis=0, workers=-1)
+    spectrum_2 = rfft(data_2[::-1].astype(np.float32), fft_length, axis=0, workers=-1)
+    spectrum = (spectrum_1 * spectrum_2).sum(axis=1)
+    corr = irfft(spectrum, fft_length, workers=-1)[:length]
 
-    corr = correlate(data_1_padded, data_2, mode="valid")
+    # Behave as if `data_1` were padded with its median so that we get clearer
+    # results than padding with 0, without tripling the FFT size
+    median = np.median(data_1, axis=0)
+    cumsum_2 = np.concatenate(
+        (np.zeros((1, data_2.shape[1])), np.cumsum(data_2, axis=0, dtype=np.float64))
+    )
+    outside = cumsum_2[-1] - (cumsum_2[overlap_end] - cumsum_2[overlap_begin])
+    corr = corr + outside @ median
 
-    shift = np.argmax(corr) - data_2.shape[0]
+    shift = starts[np.argmax(corr)]
     offset = shift / sample_rate
 
     return offset
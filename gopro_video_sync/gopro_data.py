@@ -1,7 +1,11 @@
 from dataclasses import dataclass
-from math import ceil
-from os.path import getsize
-from typing import BinaryIO, List, Tuple
+from mmap import ACCESS_READ, mmap
+from os import fstat
+from struct import Struct
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from numba import njit, prange
 
 
 def from_bytes(*args, **kwargs):
@@ -12,6 +16,13 @@ def from_bytes(*args, **kwargs):
     return int.from_bytes(*args, **kwargs)
 
 
+# Size and key of an MP4 box
+MP4_HEADER = Struct(">I4s")
+
+# Signed 16-bit value, e.g. a GPMF "SCAL" divisor
+INT16 = Struct(">h")
+
+
 @dataclass()
 class Box:
     """Holds information about an MP4 box."""
@@ -21,9 +32,47 @@ class Box:
     size: int
 
 
-def get_boxes(f: BinaryIO, offset: int, size: int, box_path: List[str]) -> List[Box]:
+def _iter_boxes(
+    buf: memoryview, offset: int, size: int
+) -> Iterator[Tuple[bytes, int, int]]:
+    """
+    Given a buffer holding part of an MP4 file, a start offset, and the size of
+    the region to walk, lazily yields the raw key, offset, and size of each box
+    at that level.
+    """
+
+    end = offset + size
+    while offset < end:
+        box_size, key = MP4_HEADER.unpack_from(buf, offset)
+        yield key, offset, box_size
+        offset += box_size
+
+
+def _iter_box_path(
+    buf: memoryview, offset: int, size: int, box_path: List[bytes]
+) -> Iterator[Tuple[int, int]]:
+    """
+    Lazy walker behind get_boxes() taking raw keys, yielding the offset and size
+    of each final box as soon as it is found.
     """
-    Given a binary stream representing part of an MP4 file, a start offset, the
+
+    # Loops through top-level boxes, recursing when we find a box matching the
+    # first level of the path
+    for key, box_offset, box_size in _iter_boxes(buf, offset, size):
+        if key == box_path[0]:
+            if len(box_path) == 1:
+                yield box_offset, box_size
+            else:
+                yield from _iter_box_path(
+                    buf, box_offset + 8, box_size - 8, box_path[1:]
+                )
+
+
+def get_boxes(
+    buf: memoryview, offset: int, size: int, box_path: List[str]
+) -> List[Box]:
+    """
+    Given a buffer holding part of an MP4 file, a start offset, the
     size of the starting box, and a "path" of box keys leading to the desired
     boxes, returns a list of Box objects representing the final boxes. If the
     specified boxes do not exist, returns an empty list.
@@ -31,29 +80,50 @@ def get_boxes(f: BinaryIO, offset: int, size: int, box_path: List[str]) -> List[
     An example `box_path` might be `["moov", "trak", "mdia", "minf", "stbl"]`.
 
     To search a whole MP4 file, pass in the following:
-      - `f`: stream obtained from `open()` using `"rb"`
+      - `buf`: memoryview of the file, e.g. of an `mmap` opened for reading
       - `offset`: `0`
       - `size`: size of file in bytes
       - `box_path`: desired path starting from root level
     """
 
-    # Loops through top-level boxes, recursing when we find a box matching the
-    # first level of the path
-    boxes = []
-    end = offset + size
-    f.seek(offset)
-    while offset < end:
-        header = f.read(8)
-        size = from_bytes(header[0:4])
-        key = header[4:8].decode("ascii")
-        if key == box_path[0]:
-            if len(box_path) == 1:
-                boxes += [Box(key, offset, size)]
-            else:
-                boxes += get_boxes(f, offset + 8, size - 8, box_path[1:])
-        offset += size
-        f.seek(offset)
-    return boxes
+    path = [key.encode("ascii") for key in box_path]
+    return [
+        Box(box_path[-1], box_offset, box_size)
+        for box_offset, box_size in _iter_box_path(buf, offset, size, path)
+    ]
+
+
+def find_gpmf_stbl(buf: memoryview, size: int) -> Optional[Box]:
+    """
+    Given a buffer holding an MP4 file and the size of the file in bytes,
+    descends once through the "moov", "trak", "mdia", and "minf" boxes and
+    returns a Box object representing the "stbl" box of the first "minf" box
+    that contains `gmhd/gpmd`, i.e. the sample table of the GPMF track. The walk
+    stops at the first match. If there is no GPMF track, returns None.
+
+    See: https://github.com/gopro/gpmf-parser#mp4-implementation
+    """
+
+    path = [b"moov", b"trak", b"mdia", b"minf"]
+    for minf_offset, minf_size in _iter_box_path(buf, 0, size, path):
+        # Checks for the GPMF marker and captures the sample table in the same
+        # pass over the children of "minf"
+        is_gpmf = False
+        stbl = None
+        children = _iter_boxes(buf, minf_offset + 8, minf_size - 8)
+        for key, box_offset, box_size in children:
+            if key == b"gmhd":
+                is_gpmf = is_gpmf or any(
+                    child_key == b"gpmd"
+                    for child_key, _, _ in _iter_boxes(
+                        buf, box_offset + 8, box_size - 8
+                    )
+                )
+            elif key == b"stbl" and stbl is None:
+                stbl = Box("stbl", box_offset, box_size)
+        if is_gpmf and stbl is not None:
+            return stbl
+    return None
 
 
 @dataclass()
@@ -66,9 +136,9 @@ class Sample:
     size: int
 
 
-def get_samples(f: BinaryIO, stbl: Box) -> List[Sample]:
+def get_samples(buf: memoryview, stbl: Box) -> List[Sample]:
     """
-    Given a binary stream representing part of an MP4 file and the location of
+    Given a buffer holding part of an MP4 file and the location of
     the "stbl" box, returns an array of Sample objects which describe where to
     find each sample along with some of their properties.
 
@@ -76,50 +146,50 @@ def get_samples(f: BinaryIO, stbl: Box) -> List[Sample]:
     """
 
     # Get duration of each sample from "stts" atom (https://developer.apple.com/library/archive/documentation/QuickTime/QTFF/QTFFChap2/qtff2.html#//apple_ref/doc/uid/TP40000939-CH204-BBCGFJII)
-    sample_durations = []
-    stts = get_boxes(f, stbl.offset, stbl.size, box_path=["stbl", "stts"])[0]
-    f.seek(stts.offset + 12)
-    num_entries = from_bytes(f.read(4))
-    for _ in range(num_entries):
-        sample_count = from_bytes(f.read(4))
-        sample_duration = from_bytes(f.read(4))
-        sample_durations += [sample_duration] * sample_count
+    stts = get_boxes(buf, stbl.offset, stbl.size, box_path=["stbl", "stts"])[0]
+    num_entries = from_bytes(buf[stts.offset + 12 : stts.offset + 16])
+    # Each entry is a (sample count, sample duration) pair. The tables are
+    # copied out of `buf` so that no view of a memory map outlives this call,
+    # even in a traceback, which would keep the map from being closed
+    entries = np.frombuffer(
+        buf, dtype=">u4", count=num_entries * 2, offset=stts.offset + 16
+    ).astype(np.int64)
+    sample_durations = np.repeat(entries[1::2], entries[0::2])
 
     # Get size of each sample from "stsz" atom (https://developer.apple.com/library/archive/documentation/QuickTime/QTFF/QTFFChap2/qtff2.html#//apple_ref/doc/uid/TP40000939-CH204-BBCBBCGB)
-    sample_sizes = []
-    stsz = get_boxes(f, stbl.offset, stbl.size, box_path=["stbl", "stsz"])[0]
-    f.seek(stsz.offset + 12)
-    sample_size = from_bytes(f.read(4))
-    num_entries = from_bytes(f.read(4))
+    stsz = get_boxes(buf, stbl.offset, stbl.size, box_path=["stbl", "stsz"])[0]
+    sample_size = from_bytes(buf[stsz.offset + 12 : stsz.offset + 16])
+    num_entries = from_bytes(buf[stsz.offset + 16 : stsz.offset + 20])
     if sample_size != 0:
-        sample_sizes = [sample_size] * num_entries
+        sample_sizes = np.full(num_entries, sample_size, dtype=np.int64)
     else:
-        for _ in range(num_entries):
-            sample_sizes.append(from_bytes(f.read(4)))
+        sample_sizes = np.frombuffer(
+            buf, dtype=">u4", count=num_entries, offset=stsz.offset + 20
+        ).astype(np.int64)
 
     # Get offset of each sample from "stco" atom (https://developer.apple.com/library/archive/documentation/QuickTime/QTFF/QTFFChap2/qtff2.html#//apple_ref/doc/uid/TP40000939-CH204-BBCHAEEA)
-    sample_offsets = []
-    stco = get_boxes(f, stbl.offset, stbl.size, box_path=["stbl", "stco"])[0]
-    f.seek(stco.offset + 12)
-    num_entries = from_bytes(f.read(4))
-    for _ in range(num_entries):
-        sample_offsets.append(from_bytes(f.read(4)))
-
-    # Compile array of Sample objects while calculating cumulative time delta
-    samples = []
-    time_delta = 0
-    for i in range(len(sample_durations)):
-        samples.append(
-            Sample(
-                time_delta,
-                sample_durations[i],
-                sample_offsets[i],
-                sample_sizes[i],
-            )
+    stco = get_boxes(buf, stbl.offset, stbl.size, box_path=["stbl", "stco"])[0]
+    num_entries = from_bytes(buf[stco.offset + 12 : stco.offset + 16])
+    sample_offsets = np.frombuffer(
+        buf, dtype=">u4", count=num_entries, offset=stco.offset + 16
+    ).astype(np.int64)
+
+    if not sample_durations.size == sample_sizes.size == sample_offsets.size:
+        raise ValueError("Sample table entry counts do not match; may be corrupted.")
+
+    # Cumulative time delta is the running sum of the preceding durations
+    time_deltas = np.cumsum(sample_durations) - sample_durations
+
+    # Compile array of Sample objects
+    return [
+        Sample(*fields)
+        for fields in zip(
+            time_deltas.tolist(),
+            sample_durations.tolist(),
+            sample_offsets.tolist(),
+            sample_sizes.tolist(),
         )
-        time_delta += sample_durations[i]
-
-    return samples
+    ]
 
 
 @dataclass()
@@ -138,43 +208,88 @@ class GPMFBox:
     repeat: int
 
 
-def get_gpmf_boxes(
-    f: BinaryIO, offset: int, size: int, box_path: List[str]
-) -> List[GPMFBox]:
+@njit(cache=True)
+def _scan_gpmf_boxes(buf: np.ndarray, offset: int, end: int) -> np.ndarray:
+    """
+    Given a uint8 array holding a GPMF payload and the region to walk, returns
+    an (n, 6) int64 array with the key (as a big-endian uint32), offset, size,
+    type, struct size, and repeat of each box at that level.
+    """
+
+    end = min(end, buf.size)
+    boxes = np.empty((max(end - offset, 0) // 8 + 1, 6), dtype=np.int64)
+    n = 0
+    while offset + 8 <= end:
+        key = 0
+        for i in range(4):
+            key = (key << 8) | np.int64(buf[offset + i])
+        type = np.int64(buf[offset + 4])
+        struct_size = np.int64(buf[offset + 5])
+        repeat = (np.int64(buf[offset + 6]) << 8) | np.int64(buf[offset + 7])
+        # 32-bit aligned (https://github.com/gopro/gpmf-parser#alignment-and-storage)
+        size = (struct_size * repeat + 8 + 3) // 4 * 4
+        boxes[n, 0] = key
+        boxes[n, 1] = offset
+        boxes[n, 2] = size
+        boxes[n, 3] = type
+        boxes[n, 4] = struct_size
+        boxes[n, 5] = repeat
+        n += 1
+        offset += size
+    return boxes[:n]
+
+
+@njit(cache=True, parallel=True)
+def _decode_int16_be(
+    buf: np.ndarray, offsets: np.ndarray, counts: np.ndarray, scales: np.ndarray
+) -> np.ndarray:
+    """
+    Given a uint8 array, the offsets and lengths (in triples) of blocks of
+    big-endian signed 16-bit triples, and a float32 scale factor per block,
+    decodes and scales the blocks in parallel and returns them concatenated as a
+    (sum(counts), 3) float32 array.
     """
-    Given a binary stream representing part of a GPMF payload, a start offset,
-    the size of the starting box, and a "path" of box keys leading to the
-    desired boxes, returns a list of GPMFBox objects representing the final
-    boxes. If the specified boxes do not exist, returns an empty list.
 
-    An example `box_path` might be `["DEVC", "STRM", "ACCL"]`.
+    starts = np.zeros(offsets.size + 1, dtype=np.int64)
+    for p in range(offsets.size):
+        if offsets[p] < 0 or offsets[p] + 6 * counts[p] > buf.size:
+            raise ValueError("Sensor data extends past the end of the buffer.")
+        starts[p + 1] = starts[p] + counts[p]
+
+    data = np.empty((starts[-1], 3), dtype=np.float32)
+    for p in prange(offsets.size):
+        for i in range(counts[p]):
+            for j in range(3):
+                index = offsets[p] + 6 * i + 2 * j
+                value = (np.int32(buf[index]) << 8) | np.int32(buf[index + 1])
+                if value >= 0x8000:
+                    value -= 0x10000
+                data[starts[p] + i, j] = np.float32(value) * scales[p]
+    return data
+
+
+def parse_gpmf(
+    buf: np.ndarray, offset: int = 0, size: Optional[int] = None
+) -> Dict[str, List[GPMFBox]]:
+    """
+    Given a uint8 array holding a GPMF payload, a start offset, and the size of
+    the region to walk (defaults to the rest of the array), scans the boxes at
+    that level once and returns a dict mapping each key to the list of GPMFBox
+    objects with that key, in the order they appear.
 
     See: https://github.com/gopro/gpmf-parser#definitions
     """
 
-    # Loops through top-level boxes, recursing when we find a box matching the
-    # first level of the path
-    boxes = []
-    end = offset + size
-    f.seek(offset)
-    while offset < end:
-        header = f.read(8)
-        key = header[0:4].decode("ascii")
-        if from_bytes(header[4:5]) == 0:
-            type = None
-        else:
-            type = header[4:5].decode("ascii")
-        struct_size = from_bytes(header[5:6])
-        repeat = from_bytes(header[6:8])
-        # 32-bit aligned (https://github.com/gopro/gpmf-parser#alignment-and-storage)
-        size = ceil((struct_size * repeat + 8) / 4) * 4
-        if key == box_path[0]:
-            if len(box_path) == 1:
-                boxes += [GPMFBox(key, offset, size, type, struct_size, repeat)]
-            elif type is None:
-                boxes += get_gpmf_boxes(f, offset + 8, size - 8, box_path[1:])
-        offset += size
-        f.seek(offset)
+    boxes = {}
+    end = buf.size if size is None else offset + size
+    for key, offset, size, type, struct_size, repeat in _scan_gpmf_boxes(
+        buf, offset, end
+    ).tolist():
+        key = key.to_bytes(4, "big").decode("ascii")
+        type = None if type == 0 else chr(type)
+        boxes.setdefault(key, []).append(
+            GPMFBox(key, offset, size, type, struct_size, repeat)
+        )
     return boxes
 
 
@@ -186,6 +301,9 @@ class Sensor3AxisStream:
     The order of the data depends on the model of GoPro, but there is usually a
     short description of the format in the `name`.
 
+    The samples are stored in `data` as a contiguous `(sample_count, 3)`
+    float32 array, one row per sample.
+
     See: https://github.com/gopro/gpmf-parser#where-to-find-gpmf-data
     """
 
@@ -195,14 +313,117 @@ class Sensor3AxisStream:
     name: str
     units: str
 
-    data: List[Tuple[float, float, float]]
+    data: np.ndarray
+
+
+def get_3axis_sensor_streams(
+    buf: memoryview, samples: List[Sample], sensor_keys: List[str]
+) -> List[Sensor3AxisStream]:
+    """
+    Given a buffer holding part of an MP4 file, a list of Sample objects, and
+    the FourCCs of the desired GPMF streams (e.g. `["ACCL", "GYRO"]`), compiles
+    the sensor data and other metadata of every stream across payloads in a
+    single pass, parsing each payload only once.
+
+    Returns a list of Sensor3AxisStream objects in the order of `sensor_keys`.
+
+    See: https://github.com/gopro/gpmf-parser#property-hierarchy
+    """
+
+    streams = [
+        Sensor3AxisStream(key, 0, 0, "", "", np.empty((0, 3), dtype=np.float32))
+        for key in sensor_keys
+    ]
+    # Where each stream's samples are in every payload, as (offset, count, scale
+    # divisor) tuples, so that all payloads can be decoded at once
+    blocks = [[] for _ in sensor_keys]
+    # Drops the uint8 view of `buf` however we leave, since a traceback keeping it
+    # alive would stop a memory map behind `buf` from being closed
+    buf_u8 = np.frombuffer(buf, dtype=np.uint8)
+    try:
+        for sample in samples:
+            # Indexes the children of every "strm" box in the payload by key, and
+            # maps each key to the first "strm" box containing it
+            strms = {}
+            try:
+                for devc in parse_gpmf(buf_u8, sample.offset, sample.size).get(
+                    "DEVC", []
+                ):
+                    for box in parse_gpmf(buf_u8, devc.offset + 8, devc.size - 8).get(
+                        "STRM", []
+                    ):
+                        children = parse_gpmf(buf_u8, box.offset + 8, box.size - 8)
+                        for key in children:
+                            strms.setdefault(key, children)
+            except:
+                strms = None
+            # Raised outside the except block so that the original error, whose
+            # traceback references `buf_u8`, isn't chained onto it
+            if strms is None:
+                raise ValueError(f"Error parsing GPMF payload; may be corrupted.")
+
+            for stream, stream_blocks in zip(streams, blocks):
+                # Finds the top-level "strm" box for the sensor data stream
+                strm = strms.get(stream.key)
+                if strm is None:
+                    raise ValueError(
+                        f"GPMF payload does not contain {stream.key} data."
+                    )
+
+                # Gets the scale factor for the data
+                scal = strm["SCAL"][0]
+                (scale_divisor,) = INT16.unpack_from(buf, scal.offset + 8)
+
+                # Records where the samples are, each being 3 signed 16-bit values
+                sensor_box = strm[stream.key][0]
+                if sensor_box.struct_size != 6:
+                    raise ValueError(
+                        f"GPMF {stream.key} samples are not 3-axis 16-bit data."
+                    )
+                stream_blocks.append(
+                    (sensor_box.offset + 8, sensor_box.repeat, scale_divisor)
+                )
+
+                # Get the stream name
+                if stream.name == "":
+                    stnm = strm["STNM"][0]
+                    start = stnm.offset + 8
+                    stream.name = bytes(
+                        buf[start : start + stnm.struct_size * stnm.repeat]
+                    ).decode("ascii")
+
+                # Get units (https://github.com/gopro/gpmf-parser#standard-units-for-physical-properties-supported-by-siun)
+                if stream.units == "":
+                    siun = strm["SIUN"][0]
+                    start = siun.offset + 8
+                    # Special characters (https://github.com/gopro/gpmf-parser#special-ascii-characters)
+                    # are °, ², ³, and µ at the same code points in Latin-1
+                    stream.units = bytes(
+                        buf[start : start + siun.struct_size * siun.repeat]
+                    ).decode("latin-1")
+
+                stream.duration += sample.duration
+                stream.sample_count += sensor_box.repeat
+
+        for stream, stream_blocks in zip(streams, blocks):
+            # Extracts the actual samples of every payload in parallel, scaling them
+            # as they are converted to float
+            offsets, counts, scale_divisors = (
+                np.array(stream_blocks, dtype=np.int64).reshape(-1, 3).T
+            )
+            scales = np.float32(1) / scale_divisors.astype(np.float32)
+            stream.data = _decode_int16_be(buf_u8, offsets, counts, scales)
+    finally:
+        del buf_u8
+
+    return streams
 
 
 def get_3axis_sensor_data(
-    f: BinaryIO, samples: List[Sample], sensor_key: str
+    buf: memoryview, samples: List[Sample], sensor_key: str
 ) -> Sensor3AxisStream:
     """
-    Given a binary stream representing part of an MP4 file, a list of Sample
+    Given a buffer holding part of an MP4 file, a list of Sample
     objects, and the FourCC of the desired GPMF stream (either "ACCL" or
     "GYRO"), compiles the sensor data and other metadata across payloads.
 
@@ -211,73 +432,7 @@ def get_3axis_sensor_data(
     See: https://github.com/gopro/gpmf-parser#property-hierarchy
     """
 
-    data = []
-    duration = 0
-    sample_count = 0
-    name = ""
-    units = ""
-    for sample in samples:
-        # Finds the top-level "strm" box for the sensor data stream
-        strm = None
-        try:
-            strm_boxes = get_gpmf_boxes(f, sample.offset, sample.size, ["DEVC", "STRM"])
-        except:
-            raise ValueError(f"Error parsing GPMF payload; may be corrupted.")
-        strm_boxes = get_gpmf_boxes(f, sample.offset, sample.size, ["DEVC", "STRM"])
-        for box in strm_boxes:
-            if get_gpmf_boxes(f, box.offset, box.size, ["STRM", sensor_key]):
-                strm = box
-                break
-        if strm is None:
-            raise ValueError(f"GPMF payload does not contain {sensor_key} data.")
-
-        # Gets the scale factor for the data
-        scal = get_gpmf_boxes(f, strm.offset, strm.size, ["STRM", "SCAL"])[0]
-        f.seek(scal.offset + 8)
-        scale_divisor = from_bytes(f.read(2), signed=True)
-
-        # Extracts the actual samples and scales them
-        sensor_box = get_gpmf_boxes(f, strm.offset, strm.size, ["STRM", sensor_key])[0]
-        f.seek(sensor_box.offset + 8)
-        for _ in range(sensor_box.repeat):
-            data.append(
-                tuple(
-                    [
-                        from_bytes(f.read(2), signed=True) / scale_divisor
-                        for _ in range(3)
-                    ]
-                )
-            )
-
-        # Get the stream name
-        if name == "":
-            stnm = get_gpmf_boxes(f, strm.offset, strm.size, ["STRM", "STNM"])[0]
-            f.seek(stnm.offset + 8)
-            name = f.read(stnm.struct_size * stnm.repeat).decode("ascii")
-
-        # Get units (https://github.com/gopro/gpmf-parser#standard-units-for-physical-properties-supported-by-siun)
-        if units == "":
-            siun = get_gpmf_boxes(f, strm.offset, strm.size, ["STRM", "SIUN"])[0]
-            f.seek(siun.offset + 8)
-            # Special characters (https://github.com/gopro/gpmf-parser#special-ascii-characters)
-            for _ in range(siun.struct_size * siun.repeat):
-                unit_char = f.read(1)
-                unit_char_value = from_bytes(unit_char)
-                if unit_char_value == 0xB0:
-                    units += "°"
-                elif unit_char_value == 0xB2:
-                    units += "²"
-                elif unit_char_value == 0xB3:
-                    units += "³"
-                elif unit_char_value == 0xB5:
-                    units += "µ"
-                else:
-                    units += unit_char.decode("ascii")
-
-        duration += sample.duration
-        sample_count += sensor_box.repeat
-
-    return Sensor3AxisStream(sensor_key, duration, sample_count, name, units, data)
+    return get_3axis_sensor_streams(buf, samples, [sensor_key])[0]
 
 
 def get_gopro_accel_gyro(video: str) -> Tuple[Sensor3AxisStream, Sensor3AxisStream]:
@@ -288,20 +443,17 @@ def get_gopro_accel_gyro(video: str) -> Tuple[Sensor3AxisStream, Sensor3AxisStre
     """
 
     with open(video, "rb") as f:
-        # Verify that the video contains a GPMF track and get the sample table (https://github.com/gopro/gpmf-parser#mp4-implementation)
-        size = getsize(video)
-        stbl = None
-        minf_boxes = get_boxes(f, 0, size, ["moov", "trak", "mdia", "minf"])
-        for box in minf_boxes:
-            if get_boxes(f, box.offset, box.size, ["minf", "gmhd", "gpmd"]):
-                stbl = get_boxes(f, box.offset, box.size, ["minf", "stbl"])[0]
-                break
-        if stbl is None:
+        # An empty file can't be memory-mapped (or contain GPMF data)
+        if fstat(f.fileno()).st_size == 0:
             raise ValueError("Video does not contain GPMF data.")
 
-        samples = get_samples(f, stbl)
+        with mmap(f.fileno(), 0, access=ACCESS_READ) as mm, memoryview(mm) as buf:
+            # Verify that the video contains a GPMF track and get the sample table (https://github.com/gopro/gpmf-parser#mp4-implementation)
+            stbl = find_gpmf_stbl(buf, len(buf))
+            if stbl is None:
+                raise ValueError("Video does not contain GPMF data.")
 
-        return (
-            get_3axis_sensor_data(f, samples, "ACCL"),
-            get_3axis_sensor_data(f, samples, "GYRO"),
-        )
+            samples = get_samples(buf, stbl)
+
+            accel, gyro = get_3axis_sensor_streams(buf, samples, ["ACCL", "GYRO"])
+            return (accel, gyro)
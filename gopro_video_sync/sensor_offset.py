@@ -16,21 +16,17 @@ def regularize_stream_timescale(
     Returns the regularized `stream_2` as a Sensor3AxisStream object.
     """
 
-    new_data = []
-    i = 0
     length = (
         stream_1.sample_count
         if same_length
         else int(stream_1.sample_count / stream_1.duration * stream_2.duration)
     )
-    for i in range(length):
-        index = round(
-            ((stream_1.duration / stream_1.sample_count) * i / stream_2.duration)
-            * stream_2.sample_count
-        )
-        if index > stream_2.sample_count - 1:
-            index = stream_2.sample_count - 1
-        new_data.append(stream_2.data[index])
+    sample_period = stream_1.duration / stream_1.sample_count
+    indices = np.rint(
+        (sample_period * np.arange(length) / stream_2.duration) * stream_2.sample_count
+    ).astype(np.int64)
+    np.clip(indices, 0, stream_2.sample_count - 1, out=indices)
+    new_data = stream_2.data[indices]
 
     return Sensor3AxisStream(
         stream_2.key,
@@ -54,13 +50,18 @@ def get_sensor_offset(
     negative value).
     """
 
-    array1 = np.array(stream_1.data)
-    array2 = np.array(regularize_stream_timescale(stream_1, stream_2).data)
+    array1 = stream_1.data
+    array2 = regularize_stream_timescale(stream_1, stream_2).data
 
     if use_magnitude:
         magnitudes_1 = (array1 * array1).sum(axis=1)
         magnitudes_2 = (array2 * array2).sum(axis=1)
 
+        # Remove the DC bias (mostly gravity for the accelerometer) so that the
+        # correlation peak isn't dominated by the amount of overlap
+        magnitudes_1 -= magnitudes_1.mean()
+        magnitudes_2 -= magnitudes_2.mean()
+
         array1 = magnitudes_1
         array2 = magnitudes_2
 
@@ -16,6 +16,7 @@ setup(
     long_description_content_type="text/markdown",
     install_requires=[
         "moviepy",
+        "numba",
         "numpy",
         "scipy",
     ],